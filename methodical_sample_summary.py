@@ -44,7 +44,7 @@ language that a keyword list can miss.
 
 # TROUBLESHOOTING
 - OAuthException → check CLIENT_ID/CLIENT_SECRET and app type (script).
-- 429 TooManyRequests → the script backs off; consider lowering probes, raising sleeps.
+- 429 TooManyRequests → the script backs off; consider lowering probes or --workers.
 - "Set LATEST_ISO_UTC" → provide --latest in ISO UTC (YYYY-MM-DDTHH:MM:SS).
 
 # ETHICS
@@ -53,13 +53,24 @@ Use in accordance with Reddit Data API Terms. Avoid redistributing PII.
 from __future__ import annotations
 import argparse
 import csv
+import heapq
+import json
+import multiprocessing
 import os
 import pathlib
+import pickle
+import queue
+import random
 import re
+import sqlite3
 import sys
+import threading
 import time
-from collections import Counter, defaultdict
+from collections import Counter, defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime, timezone
+from functools import lru_cache
+from itertools import compress, islice
 from typing import Iterable
 
 # optional .env
@@ -71,10 +82,14 @@ except Exception:
 # third‑party
 try:
     import praw  # type: ignore
-    from prawcore.exceptions import TooManyRequests  # type: ignore
+    from praw.models import MoreComments  # type: ignore
+    from prawcore import Requestor  # type: ignore
+    from prawcore.exceptions import ServerError, TooManyRequests  # type: ignore
 except Exception:
     praw = None  # type: ignore
-    TooManyRequests = Exception  # type: ignore
+    MoreComments = ()  # type: ignore  # isinstance(x, ()) is always False
+    Requestor = object  # type: ignore
+    TooManyRequests = ServerError = Exception  # type: ignore
 
 # ------------------- tokenization & filters -------------------
 STOPWORDS = {
@@ -85,48 +100,67 @@ STOPWORDS = {
     "who","why","will","with","you","your","yours"
 }
 DOMAIN_STOP: set[str] = set()
-WORD_RE = re.compile(r"[A-Za-z0-9']+")
+BAD_TOKENS = frozenset(STOPWORDS | DOMAIN_STOP)  # one membership probe instead of two
+LINK_RE = re.compile(r"http\S+|www\.\S+")
+# tokens are runs of [A-Za-z0-9'], lowercased. The table lowercases A-Z and turns
+# everything outside [a-z0-9'] into a space, so translate + split tokenizes in C
+TOKEN_TABLE = str.maketrans({chr(c): (chr(c).lower() if chr(c).isalnum() or chr(c) == "'" else " ")
+                             for c in range(128)})
+# the same table for bytes; non-ASCII text is encoded with '?' (-> space) for every
+# non-ASCII character, which only ever separates tokens...
+TOKEN_BYTES_TABLE = bytes(ord(TOKEN_TABLE[c]) if c < 128 else 32 for c in range(256))
+# ...except these two, whose lowercase is ASCII (U+0130 -> "i" + dot, Kelvin sign -> "k")
+LOWER_TO_ASCII = ("\u0130", "\u212a")
 
 def clean_text(s: str) -> str:
+    # only links need removing: tokenize() already splits on -_/ and whitespace,
+    # so rewriting those to spaces was a full extra pass with no effect on tokens
     if not s:
         return ""
-    s = re.sub(r"http\S+|www\.\S+", " ", s)
-    s = re.sub(r"[-_/]", " ", s)
-    return re.sub(r"\s+", " ", s).strip()
+    if "http" not in s and "www." not in s:
+        return s  # substring scans are far cheaper than running the regex
+    return LINK_RE.sub(" ", s)
 
 def tokenize(s: str):
-    return WORD_RE.findall(s.lower())
-
-def valid_unigram(tok: str) -> bool:
-    if tok in STOPWORDS or tok in DOMAIN_STOP:
-        return False
-    if len(tok) < 3:
-        return False
-    if tok.isdigit():
-        return False
-    return True
-
-def valid_bigram(t1: str, t2: str) -> bool:
-    if t1 in STOPWORDS or t2 in STOPWORDS:
-        return False
-    if t1 in DOMAIN_STOP or t2 in DOMAIN_STOP:
-        return False
-    if len(t1) < 2 or len(t2) < 2:
-        return False
-    return True
+    # interned: repeats of a word share one object, so Counter/stopword lookups
+    # hit the identity fast path and bigram keys reuse the unigram strings
+    if s.isascii():
+        return list(map(sys.intern, s.translate(TOKEN_TABLE).split()))  # lowercases in the same pass
+    # non-ASCII: a whole-string lower() is only needed for the two characters above;
+    # otherwise go through bytes, where the table lowercases and blanks in one C pass
+    if LOWER_TO_ASCII[0] in s or LOWER_TO_ASCII[1] in s:
+        s = s.lower()
+    s = s.encode("ascii", "replace").translate(TOKEN_BYTES_TABLE).decode("ascii")
+    return list(map(sys.intern, s.split()))
 
 def bigrams(tokens: list[str]):
-    for i in range(len(tokens) - 1):
-        yield tokens[i], tokens[i + 1]
+    return zip(tokens, tokens[1:])
 
 # ------------------- time helpers -------------------
 
 def to_epoch_utc(iso_str: str | None):
     if not iso_str:
         return None
-    dt = datetime.strptime(iso_str, "%Y-%m-%dT%H:%M:%S").replace(tzinfo=timezone.utc)
+    # fromisoformat is a C parser (strptime re-parses its format string in Python on
+    # every call); naive input, the documented form, is taken as UTC
+    dt = datetime.fromisoformat(iso_str)
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
     return int(dt.timestamp())
 
+# Reddit search `t=` buckets (each reaches back from "now"); month/year lengths
+# are lower bounds so a chosen bucket never cuts into the window
+TIME_FILTERS = (("hour", 3600), ("day", 86400), ("week", 7 * 86400),
+                ("month", 28 * 86400), ("year", 365 * 86400))
+
+def search_time_filter(earliest_epoch: int | None, until: float) -> str:
+    """Narrowest `t=` bucket that still covers earliest_epoch for a search paging until `until`."""
+    if earliest_epoch is not None:
+        for name, span in TIME_FILTERS:
+            if until - span <= earliest_epoch:
+                return name
+    return "all"
+
 # ------------------- polite I/O helpers -------------------
 
 def polite_sleep(n: float):
@@ -135,13 +169,116 @@ def polite_sleep(n: float):
     except KeyboardInterrupt:
         raise
 
-def backoff_call(fn, *args, **kwargs):
+BACKOFF_TRIES = 5  # attempts per call before the error propagates
+
+def backoff_delay(exc: Exception, attempt: int) -> float:
+    """Seconds to wait before retry `attempt` (0-based): the server's Retry-After when
+    it sent one, else 2, 4, 8… capped at 60; plus jitter so threads don't retry in lockstep."""
     try:
-        return fn(*args, **kwargs)
-    except TooManyRequests:
-        print("[rate-limit] 429; sleeping 60s…")
-        polite_sleep(62)
-        return fn(*args, **kwargs)
+        delay = float(getattr(exc, "retry_after", None))
+    except (TypeError, ValueError):
+        delay = min(60, 2 ** (attempt + 1))
+    return delay + random.uniform(0, 1)
+
+def backoff_call(fn, *args, **kwargs):
+    for attempt in range(BACKOFF_TRIES):
+        try:
+            return fn(*args, **kwargs)
+        except (TooManyRequests, ServerError) as e:
+            if attempt == BACKOFF_TRIES - 1:
+                raise
+            delay = backoff_delay(e, attempt)
+            print(f"[rate-limit] {type(e).__name__}; retrying in {delay:.0f}s…")
+            polite_sleep(delay)
+
+class TokenBucket:
+    """Thread-safe request pacing shared by the fetch threads: up to `burst`
+    requests back to back, then `rate` per second on average."""
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.last = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+                self.last = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            polite_sleep(wait)  # sleep outside the lock so other threads can refill/check
+
+class PacedRequestor(Requestor):
+    """prawcore Requestor that takes a token from `bucket` before every HTTP request,
+    so search pages, comment trees and token refreshes all count against --max-rpm."""
+
+    def __init__(self, *args, bucket: TokenBucket | None = None, **kwargs):
+        self.bucket = bucket
+        super().__init__(*args, **kwargs)
+
+    def request(self, *args, **kwargs):
+        if self.bucket is not None:
+            self.bucket.acquire()
+        return super().request(*args, **kwargs)
+
+def quota_left(clients: list) -> str:
+    """Requests left in Reddit's current window (X-Ratelimit-Remaining, as tracked by prawcore).
+
+    Each fetch thread has its own client; the lowest figure among them is reported.
+    """
+    left = []
+    for reddit in list(clients):
+        try:
+            remaining = reddit.auth.limits.get("remaining")
+        except Exception:
+            continue
+        if remaining is not None:
+            left.append(remaining)
+    return str(int(min(left))) if left else "?"
+
+# ------------------- post cache -------------------
+
+POST_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "methodical_sample", "posts.db")
+
+class PostCache:
+    """SQLite store of each post's sampled comments, shared by the fetch threads.
+
+    Search pages still have to be fetched (they decide which posts match), but a
+    cached post skips its comment request, the one request every post costs.
+    """
+
+    def __init__(self, path: str):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        # autocommit + WAL: each write is durable without holding a transaction open
+        self.db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.execute("CREATE TABLE IF NOT EXISTS comments (id TEXT PRIMARY KEY,"
+                        " comment_limit INTEGER, bodies TEXT)")
+        self.lock = threading.Lock()
+
+    def comments(self, pid: str, limit: int) -> list[str] | None:
+        """Cached comment bodies for `pid`, or None if it was never fetched with at least `limit`."""
+        with self.lock:
+            row = self.db.execute("SELECT comment_limit, bodies FROM comments WHERE id = ?", (pid,)).fetchone()
+        if row is None or row[0] < limit:
+            return None
+        return json.loads(row[1])[:limit]
+
+    def put(self, pid: str, limit: int, comments: list[str]):
+        with self.lock:
+            self.db.execute("INSERT OR REPLACE INTO comments VALUES (?, ?, ?)",
+                            (pid, limit, json.dumps(comments)))
+
+    def close(self):
+        with self.lock:
+            self.db.close()
 
 # ------------------- doctor -------------------
 
@@ -184,99 +321,382 @@ def run_doctor(args) -> int:
     print("All essential checks passed.")
     return 0
 
+# ------------------- fetching -------------------
+
+def fetch_probe(sr, sub: str, probe: str, earliest_epoch: int | None, latest_epoch: int,
+                deadline: float, max_per_probe: int, include_comments: bool, max_comments: int,
+                emit, stop: threading.Event,
+                route: dict[str, str] | None = None, claim=None,
+                cache: PostCache | None = None) -> bool:
+    """Stream one search's posts to emit(); False if the time budget or `stop` cut it short."""
+    if time.time() > deadline or stop.is_set():
+        return False  # budget spent (or run abandoned) while queued: don't fetch a page
+    # paginate back via keyword search, newest first, so the walk can stop at --earliest;
+    # posts newer than --latest can't be skipped server-side and are dropped below,
+    # while `t=` keeps the server from ranking anything older than the window
+    results = sr.search(query=probe, sort="new",
+                        time_filter=search_time_filter(earliest_epoch, deadline),
+                        limit=None, params={"restrict_sr": 1})
+    taken: dict[str, int] = {}
+    full: set[str] = set()  # subreddits that already have max_per_probe posts
+    targets = len(route) if route else 1
+    earliest = earliest_epoch or 0  # no --earliest: 0 never trips the break, no None check per post
+    while True:
+        # the listing only hits the network inside next(); a failed page fetch leaves
+        # its cursor in place, so calling next() again retries that same page
+        submission = backoff_call(next, results, None)
+        if submission is None:
+            break
+        if time.time() > deadline or stop.is_set():
+            return False
+
+        # listing items arrive fully populated; read the attribute dict once instead of
+        # getattr, whose PRAW fallback fetches the submission again when a field is missing
+        data = vars(submission)
+        created = int(data.get("created_utc") or 0)
+        if created == 0 or created > latest_epoch:
+            continue
+        if created < earliest:
+            break  # older than window; next probe
+
+        post_sub = sub
+        if route is not None:
+            post_sub = route.get(getattr(data.get("subreddit"), "display_name", "").lower())
+            if post_sub is None:
+                continue
+        n = taken.get(post_sub, 0)
+        if n >= max_per_probe:
+            full.add(post_sub)
+            if len(full) == targets:
+                break
+            continue
+        taken[post_sub] = n + 1
+        if claim is not None and not claim(data.get("id")):
+            continue  # overlapping probe: already fetched (and counted) elsewhere
+
+        # titles + selftext (comments optional and off by default)
+        post = {"sub": post_sub,
+                "id": data.get("id"),
+                "title": data.get("title") or "",
+                "selftext": data.get("selftext") or "",
+                "comments": []}
+
+        cached = None
+        if include_comments and max_comments > 0 and cache is not None and post["id"] is not None:
+            cached = cache.comments(post["id"], max_comments)
+        if cached is not None:
+            post["comments"] = cached
+        elif include_comments and max_comments > 0:
+            try:
+                # PRAW asks for up to 2048 comments per tree by default; request only as many
+                # as we keep (Reddit's `limit`), so the response is a fraction of the size
+                submission.comment_limit = max_comments
+                forest = backoff_call(getattr, submission, "comments")
+                for c in islice(iter_comments(forest), max_comments):
+                    post["comments"].append(getattr(c, "body", "") or "")
+                if cache is not None and post["id"] is not None:
+                    cache.put(post["id"], max_comments, post["comments"])
+            except Exception:
+                # comments are best‑effort
+                pass
+        emit(post)
+    return True
+
+def iter_comments(forest):
+    """Breadth-first comments, skipping MoreComments stubs: the order of
+    replace_more(limit=0) + .list(), but lazy, so islice stops the walk early."""
+    todo = deque(forest)
+    while todo:
+        c = todo.popleft()
+        if isinstance(c, MoreComments):
+            continue
+        yield c
+        todo.extend(c.replies)
+
+# ------------------- checkpoints -------------------
+
+CHECKPOINT_EVERY = 500  # counted posts between checkpoint writes
+CHECKPOINT_FORMAT = 2   # bump when the saved counter layout changes (2: bigram keys are (t1, t2) tuples)
+
+def load_checkpoint(path: str | None, window: tuple) -> dict | None:
+    if not path or not os.path.exists(path):
+        return None
+    with open(path, "rb") as f:
+        state = pickle.load(f)
+    if state.get("format") != CHECKPOINT_FORMAT:
+        print(f"[checkpoint] {path} was written by an older version; starting fresh.")
+        return None
+    if state.get("window") != window:
+        print(f"[checkpoint] {path} was written for a different time window; starting fresh.")
+        return None
+    return state
+
+def save_checkpoint(path: str, state: dict):
+    # write then rename, so a crash mid-write never leaves a truncated checkpoint
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp, path)
+
 # ------------------- harvesting -------------------
 
-def harvest(reddit, subreddits: list[str], probes: list[str], earliest_iso: str | None,
+def count_text(text: str, uni: Counter, bi: Counter):
+    toks = tokenize(clean_text(text))
+    # filters stay inline (no call frame per token): a unigram is 3+ chars, not a
+    # stopword and not all digits; a bigram is two ADJACENT 2+ char non-stopwords.
+    # Judge each token once (the only stopword probe) and reuse the verdicts for both
+    ok = [len(t) >= 2 and t not in BAD_TOKENS for t in toks]
+    uni.update([t for t in compress(toks, ok) if len(t) >= 3 and not t.isdigit()])
+    # one update per text: Counter counts the whole batch in C. Keys stay (t1, t2)
+    # tuples of interned tokens (no per-pair string build); main() joins the top N
+    bi.update([pair for pair, ok1, ok2 in zip(bigrams(toks), ok, ok[1:]) if ok1 and ok2])
+
+def count_post(post: dict, uni: Counter, bi: Counter):
+    # title and selftext are separate passes: no joined copy, and no bigram
+    # spanning the last title word and the first body word
+    count_text(post["title"], uni, bi)
+    count_text(post["selftext"], uni, bi)
+    for body in post["comments"]:
+        count_text(body, uni, bi)
+
+def count_posts(posts: list[dict]) -> tuple[Counter, Counter]:
+    """Process-pool entry point: count a batch of posts into fresh Counters."""
+    uni, bi = Counter(), Counter()
+    for post in posts:
+        count_post(post, uni, bi)
+    return uni, bi
+
+COUNT_BATCH = 256  # posts per process-pool task when --cpu-workers > 0
+
+def harvest(connect, subreddits: list[str], probes: list[str], earliest_iso: str | None,
             latest_iso: str, time_budget_min: int, max_per_probe: int,
-            include_comments: bool, max_comments: int, per_post_pause: float,
-            sleep_every: int, sleep_seconds: float, verbose: bool):
+            include_comments: bool, max_comments: int, workers: int, cpu_workers: int,
+            max_rpm: int, multireddit: bool, checkpoint: str | None, cache_path: str | None,
+            verbose: bool):
 
     earliest_epoch = to_epoch_utc(earliest_iso)
     latest_epoch = to_epoch_utc(latest_iso)
     assert latest_epoch is not None, "latest epoch required"
 
-    uni_per_sub: dict[str, Counter] = defaultdict(Counter)
-    bi_per_sub: dict[str, Counter] = defaultdict(Counter)
-
-    started = time.time()
-    requests_made = 0
-
-    for sub in subreddits:
-        sr = reddit.subreddit(sub)
+    # one Counter per requested subreddit up front: no defaultdict miss path, and
+    # subreddits that yield nothing still show up (empty) for the writers
+    uni_per_sub: dict[str, Counter] = {sub: Counter() for sub in subreddits}
+    bi_per_sub: dict[str, Counter] = {sub: Counter() for sub in subreddits}
+    # overlapping probes return the same submission; each post counts once.
+    # `seen` holds counted ids (checkpointed); fetch threads dedupe through claim()
+    seen: set[str] = set()
+    # a search covers one subreddit, or with --multireddit all of them at once as r/a+b+c
+    # (one request stream per probe; posts are filed by their own subreddit)
+    scopes = ["+".join(subreddits)] if multireddit else list(subreddits)
+    route = {sub.lower(): sub for sub in subreddits} if multireddit else None
+    # (scope, probe) searches that ran to completion; a resumed run skips them
+    done: set[tuple[str, str]] = set()
+
+    window = (earliest_iso, latest_iso)
+    state = load_checkpoint(checkpoint, window)
+    if state is not None:
+        uni_per_sub.update(state["uni"])
+        bi_per_sub.update(state["bi"])
+        seen.update(state["seen"])
+        done.update(state["done"])
         if verbose:
-            print(f"[{sub}] sampling with {len(probes)} probes…")
-        for probe in probes:
-            # paginate back via keyword search; sort=new so we can time‑bound
-            results = backoff_call(sr.search, query=probe, sort="new", limit=None, params={"restrict_sr": 1})
-            taken = 0
-            for submission in results:
-                if time.time() - started > time_budget_min * 60:
-                    if verbose: print("⏱️ time budget reached; finishing…")
-                    return uni_per_sub, bi_per_sub
-
-                created = int(getattr(submission, "created_utc", 0)) or 0
-                if created == 0:
-                    continue
-                if created > latest_epoch:
+            print(f"[checkpoint] resuming {checkpoint}: {len(done)} searches already complete")
+
+    deadline = time.time() + time_budget_min * 60
+
+    # PRAW is not thread-safe (prawcore's rate limiter updates its state without a lock),
+    # so every fetch thread gets its own client from connect(); each prawcore limiter only
+    # sees its own requests, so all clients send through one token bucket (--max-rpm)
+    local = threading.local()
+    clients: list = []
+
+    def client():
+        reddit = getattr(local, "reddit", None)
+        if reddit is None:
+            reddit = local.reddit = connect(bucket)
+            clients.append(reddit)
+        return reddit
+
+    # ids taken by some fetch thread; a duplicate is dropped before its comments are fetched
+    claimed = set(seen)
+    claim_lock = threading.Lock()
+
+    def claim(pid: str | None) -> bool:
+        if pid is None:
+            return True
+        with claim_lock:
+            if pid in claimed:
+                return False
+            claimed.add(pid)
+            return True
+    pending = {scope: sum((scope, probe) not in done for probe in probes) for scope in scopes}
+
+    # fetch threads produce (scope, probe, post); this thread counts while they wait on the network.
+    # A None post marks the end of one search; its probe is None if the search was cut short.
+    stream: queue.Queue = queue.Queue(maxsize=512)
+    stop = threading.Event()
+
+    def put(item):
+        while True:
+            try:
+                return stream.put(item, timeout=0.5)
+            except queue.Full:
+                if stop.is_set():
+                    raise  # consumer is gone (error / Ctrl-C); unblock this thread
+
+    # optional: tokenize/count in worker processes, per-subreddit batches. The pool starts its
+    # workers on the first submit, while fetch threads hold locks and sockets; forking then
+    # can deadlock a child, so workers come from a forkserver (spawn where there is none)
+    cpu_pool = None
+    if cpu_workers > 0:
+        method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+        cpu_pool = ProcessPoolExecutor(max_workers=cpu_workers,
+                                       mp_context=multiprocessing.get_context(method))
+    batches: dict[str, list[dict]] = defaultdict(list)
+    counting: dict[str, list] = defaultdict(list)
+
+    def flush(sub: str):
+        if batches[sub]:
+            counting[sub].append(cpu_pool.submit(count_posts, batches.pop(sub)))
+
+    def settle(sub: str):
+        flush(sub)
+        for fut in counting.pop(sub, []):
+            uni, bi = fut.result()
+            uni_per_sub[sub].update(uni)
+            bi_per_sub[sub].update(bi)
+
+    def save():
+        for sub in list(batches) + list(counting):
+            settle(sub)  # counts must cover every id in `seen`
+        save_checkpoint(checkpoint, {"format": CHECKPOINT_FORMAT, "window": window,
+                                     "uni": dict(uni_per_sub), "bi": dict(bi_per_sub),
+                                     "seen": seen, "done": done})
+
+    errors: list[Exception] = []
+
+    def produce(scope: str, probe: str):
+        complete = False
+        try:
+            sr = client().subreddit(scope)
+            # stop abandons the search once the consumer is gone; with route
+            # (lowercased name -> requested name) sr is a multireddit, posts are filed under
+            # their own subreddit and max_per_probe applies per subreddit; claim(id) is False
+            # for a post another search took (it still uses up max_per_probe); cache supplies
+            # and stores comment trees
+            complete = fetch_probe(sr, scope, probe, earliest_epoch, latest_epoch, deadline,
+                                   max_per_probe, include_comments, max_comments,
+                                   lambda post: put((scope, probe, post)), stop,
+                                   route=route, claim=claim, cache=cache)
+        except Exception as e:
+            # one bad search (private sub, retries used up) shouldn't cost the others' counts;
+            # it isn't marked done, so a resumed run tries it again
+            errors.append(e)
+            print(f"[{scope}] search for {probe!r} failed: {e!r}")
+        finally:
+            put((scope, probe if complete else None, None))
+
+    # comments from earlier runs; without --cache every post costs a comment request
+    cache = PostCache(cache_path) if cache_path and include_comments and max_comments > 0 else None
+
+    # one budget for all fetch threads, so more workers overlap waits without raising the request rate
+    bucket = TokenBucket(max_rpm / 60, burst=workers) if max_rpm > 0 else None
+
+    # (scope, probe) searches are independent; overlap their network waits
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        futures = []
+        for scope in scopes:
+            if verbose:
+                print(f"[{scope}] sampling with {len(probes)} probes…")
+            for probe in probes:
+                if (scope, probe) not in done:
+                    futures.append(pool.submit(produce, scope, probe))
+
+        running = len(futures)
+        since_save = 0
+        # bound once: the loop below runs per post
+        get, seen_add = stream.get, seen.add
+        try:
+            while running:
+                scope, probe, post = get()
+                if post is None:
+                    running -= 1
+                    pending[scope] -= 1
+                    if checkpoint and probe is not None:
+                        done.add((scope, probe))
+                        save()
+                        since_save = 0
+                    if pending[scope] == 0:
+                        for sub in scope.split("+"):
+                            if cpu_pool is not None:
+                                settle(sub)
+                            if verbose:
+                                print(f"[{sub}] done. unigrams={sum(uni_per_sub[sub].values())}, bigrams={sum(bi_per_sub[sub].values())}, "
+                                      f"quota left={quota_left(clients)}")
                     continue
-                if (earliest_epoch is not None) and (created < earliest_epoch):
-                    break  # older than window; next probe
-
-                taken += 1
-                if taken > max_per_probe:
-                    break
-
-                # titles + selftext (comments optional and off by default)
-                chunks = [getattr(submission, "title", "") or "", getattr(submission, "selftext", "") or ""]
-                blob = clean_text(" ".join(chunks))
-                toks = tokenize(blob)
-                uni_per_sub[sub].update([t for t in toks if valid_unigram(t)])
-                for t1, t2 in bigrams(toks):
-                    if valid_bigram(t1, t2):
-                        bi_per_sub[sub].update([("%s %s" % (t1, t2),)])
-
-                requests_made += 1
-                if (sleep_every > 0) and (requests_made % sleep_every == 0):
-                    polite_sleep(sleep_seconds)
-                polite_sleep(per_post_pause)
-
-                if include_comments and max_comments > 0:
-                    try:
-                        submission.comments.replace_more(limit=0)
-                        for i, c in enumerate(submission.comments.list()):
-                            if i >= max_comments:
-                                break
-                            body = clean_text(getattr(c, "body", "") or "")
-                            toks_c = tokenize(body)
-                            uni_per_sub[sub].update([t for t in toks_c if valid_unigram(t)])
-                            for t1, t2 in bigrams(toks_c):
-                                if valid_bigram(t1, t2):
-                                    bi_per_sub[sub].update([("%s %s" % (t1, t2),)])
-                    except Exception:
-                        # comments are best‑effort
-                        pass
-
-        if verbose:
-            print(f"[{sub}] done. unigrams={sum(uni_per_sub[sub].values())}, bigrams={sum(bi_per_sub[sub].values())}")
+                sub = post["sub"]
+                pid = post["id"]
+                if pid is not None:
+                    seen_add(pid)  # claim() already let only the first copy through
+                if cpu_pool is None:
+                    count_post(post, uni_per_sub[sub], bi_per_sub[sub])
+                else:
+                    batches[sub].append(post)
+                    if len(batches[sub]) >= COUNT_BATCH:
+                        flush(sub)
+                since_save += 1
+                if checkpoint and since_save >= CHECKPOINT_EVERY:
+                    save()
+                    since_save = 0
+            if checkpoint and since_save:
+                save()
+        finally:
+            stop.set()
+            # on error / Ctrl-C: drop searches that haven't started; running ones see `stop`
+            pool.shutdown(wait=False, cancel_futures=True)
+            if cpu_pool is not None:
+                cpu_pool.shutdown(cancel_futures=True)
+
+    if cache is not None:
+        cache.close()
+
+    if futures and len(errors) == len(futures):
+        raise errors[0]  # nothing was fetched at all (auth, network): don't write empty CSVs
+
+    if verbose and time.time() > deadline:
+        print("⏱️ time budget reached; finishing…")
 
     return uni_per_sub, bi_per_sub
 
 # ------------------- writers -------------------
 
-def write_topn_csv(per_sub_counts: dict, out_path: str, header_word: str, subreddits: list[str], top_n: int):
+def rank_top_n(per_sub_counts: dict, subreddits: list[str], top_n: int) -> dict[str, list[tuple[str, int]]]:
+    """Top N per subreddit, ranked once and shared by the CSV and overlap writers.
+
+    Ties break alphabetically: with concurrent fetching, Counter insertion order
+    (which most_common() uses for ties) varies from run to run.
+    """
+    return {sub: heapq.nsmallest(top_n, per_sub_counts[sub].items(), key=lambda kv: (-kv[1], kv[0]))
+            for sub in subreddits}
+
+def write_topn_csv(ranked: dict, out_path: str, header_word: str, subreddits: list[str]):
     with open(out_path, "w", newline="", encoding="utf-8") as f:
         w = csv.writer(f)
         w.writerow(["subreddit", header_word, "count"])
-        for sub in subreddits:
-            for key, cnt in per_sub_counts[sub].most_common(top_n):
-                w.writerow([sub, key, cnt])
+        w.writerows((sub, key, cnt) for sub in subreddits for key, cnt in ranked[sub])
 
-def load_keyword_library(path: str | None) -> set[str]:
+def load_keyword_library(path: str | None) -> frozenset[str]:
     if not path:
-        return set()
+        return frozenset()
     p = pathlib.Path(path)
     if not p.exists():
-        return set()
+        return frozenset()
+    return read_keyword_library(str(p), p.stat().st_mtime)
+
+@lru_cache(maxsize=8)
+def read_keyword_library(path: str, mtime: float) -> frozenset[str]:
+    # cached per (path, mtime): repeat loads are a dict hit, and an edited file is re-read
+    p = pathlib.Path(path)
     out: set[str] = set()
     if p.suffix.lower() == ".txt":
         for line in p.read_text(encoding="utf-8").splitlines():
@@ -293,16 +713,16 @@ def load_keyword_library(path: str | None) -> set[str]:
                     k = (row.get(col) or "").strip().lower()
                     if k:
                         out.add(k)
-    return out
+    return frozenset(out)
 
-def write_overlap_report(unis: dict, bis: dict, subreddits: list[str], library_path: str | None, top_n: int):
+def write_overlap_report(top_unis: dict, top_bis: dict, subreddits: list[str], library_path: str | None):
     lib = load_keyword_library(library_path)
     if not lib:
         return
     rows = []
     for sub in subreddits:
-        top_uni = [w for w,_ in unis[sub].most_common(top_n)]
-        top_bi  = [p for p,_ in bis[sub].most_common(top_n)]
+        top_uni = [w for w,_ in top_unis[sub]]
+        top_bi  = [p for p,_ in top_bis[sub]]
         hits_uni = [w for w in top_uni if w in lib]
         hits_bi  = [p for p in top_bi if p in lib]
         rows.append([sub, len(hits_uni), len(hits_bi), "; ".join(hits_uni), "; ".join(hits_bi)])
@@ -327,6 +747,8 @@ def main():
 
     # scope
     p.add_argument("--subs", nargs="*", default=["VeteransBenefits","Veterans","VAClaims"], help="Target subreddits.")
+    p.add_argument("--multireddit", action="store_true",
+                   help="Search all subs at once per probe (r/a+b+c): fewer requests, but they share Reddit's ~1000-result cap.")
     p.add_argument("--probes", nargs="*", default=[
         "va","benefits","disability","claim","appeal","denied","rating","compensation",
         "form","cfr","service connected","evidence","nexus","pact act","dbq",
@@ -338,13 +760,16 @@ def main():
     p.add_argument("--max-per-probe", type=int, default=80, help="Max posts per probe (default 80).")
     p.add_argument("--include-comments", action="store_true", help="Also sample comments (risk of 429).")
     p.add_argument("--max-comments-per-post", type=int, default=0, help="If sampling comments, cap per post.")
-    p.add_argument("--per-post-pause", type=float, default=0.3, help="Pause seconds per post.")
-    p.add_argument("--sleep-every", type=int, default=10, help="Sleep after N requests.")
-    p.add_argument("--sleep-seconds", type=float, default=1.5, help="Seconds to sleep each cycle.")
+    p.add_argument("--workers", type=int, default=4, help="Concurrent (subreddit, probe) searches (default 4; 1 = serial).")
+    p.add_argument("--cpu-workers", type=int, default=0, help="Processes for tokenizing/counting (default 0 = main thread).")
+    p.add_argument("--max-rpm", type=int, default=60, help="Cap on API requests per minute across all workers, every page and comment tree included (default 60; 0 = no cap).")
 
     # outputs
     p.add_argument("--top-n", type=int, default=20, help="Top N words/phrases per subreddit (default 20).")
     p.add_argument("--keyword-library", default=None, help="Optional .txt/.csv to compute overlap (column contains 'keyword').")
+    p.add_argument("--checkpoint", default=None, help="Optional file to save progress to and resume from (same window only).")
+    p.add_argument("--cache", nargs="?", const=POST_CACHE_PATH, default=None,
+                   help="Reuse comments fetched by earlier runs from a SQLite file (default ~/.cache/methodical_sample/posts.db).")
 
     # verbosity
     p.add_argument("--verbose", action="store_true", help="Print progress messages.")
@@ -369,14 +794,21 @@ def main():
     if not (cid and csec):
         raise SystemExit("Missing CLIENT_ID/CLIENT_SECRET in env or .env. Use --dotenv.")
 
-    reddit = praw.Reddit(client_id=cid, client_secret=csec, user_agent=ua,
-                         username=username, password=password, ratelimit_seconds=5)
+    def connect(bucket=None):
+        # one client per fetch thread (see harvest); every request waits on the shared bucket
+        return praw.Reddit(client_id=cid, client_secret=csec, user_agent=ua,
+                           username=username, password=password, ratelimit_seconds=5,
+                           requestor_class=PacedRequestor, requestor_kwargs={"bucket": bucket})
 
     if not args.latest:
         raise SystemExit("Provide --latest in ISO UTC (e.g., 2025-07-31T19:00:00).")
 
+    if args.cache and not (args.include_comments and args.max_comments_per_post > 0):
+        print("[cache] --cache only stores comments; ignored without --include-comments "
+              "and --max-comments-per-post.")
+
     unis, bis = harvest(
-        reddit=reddit,
+        connect=connect,
         subreddits=args.subs,
         probes=args.probes,
         earliest_iso=args.earliest,
@@ -385,17 +817,24 @@ def main():
         max_per_probe=args.max_per_probe,
         include_comments=args.include_comments,
         max_comments=args.max_comments_per_post,
-        per_post_pause=args.per_post_pause,
-        sleep_every=args.sleep_every,
-        sleep_seconds=args.sleep_seconds,
+        workers=args.workers,
+        cpu_workers=args.cpu_workers,
+        max_rpm=args.max_rpm,
+        multireddit=args.multireddit,
+        checkpoint=args.checkpoint,
+        cache_path=args.cache,
         verbose=args.verbose,
     )
 
-    write_topn_csv(unis, "top20_unigrams_by_sub.csv", "word", args.subs, args.top_n)
-    write_topn_csv(bis,  "top20_bigrams_by_sub.csv",  "phrase", args.subs, args.top_n)
+    top_unis = rank_top_n(unis, args.subs, args.top_n)
+    # bigrams are counted as (t1, t2) pairs; only the ranked few become phrases
+    top_bis = {sub: [(" ".join(pair), cnt) for pair, cnt in ranked]
+               for sub, ranked in rank_top_n(bis, args.subs, args.top_n).items()}
+    write_topn_csv(top_unis, "top20_unigrams_by_sub.csv", "word", args.subs)
+    write_topn_csv(top_bis,  "top20_bigrams_by_sub.csv",  "phrase", args.subs)
     print("Wrote: top20_unigrams_by_sub.csv, top20_bigrams_by_sub.csv")
 
-    write_overlap_report(unis, bis, args.subs, args.keyword_library, args.top_n)
+    write_overlap_report(top_unis, top_bis, args.subs, args.keyword_library)
 
 if __name__ == "__main__":
     main()